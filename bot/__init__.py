@@ -7,6 +7,7 @@ from bot.orders import (
     place_market_order,
     place_limit_order,
     place_stop_limit_order,
+    place_orders,
     get_open_orders,
     cancel_order,
     cancel_all_orders,
@@ -25,6 +26,7 @@ __all__ = [
     "place_market_order",
     "place_limit_order",
     "place_stop_limit_order",
+    "place_orders",
     "get_open_orders",
     "cancel_order",
     "cancel_all_orders",
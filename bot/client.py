@@ -5,22 +5,59 @@ Handles authentication (HMAC SHA256 signing), request construction,
 and all REST API calls to the Binance USDⓈ-M Futures Testnet.
 """
 
-import hashlib
+import asyncio
 import hmac
+import logging
 import os
+import threading
 import time
 from urllib.parse import urlencode
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 from bot.logging_config import get_logger
 
+# orjson parses typical Binance payloads several times faster than the
+# stdlib; fall back silently when it is not installed.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    import json
+    _json_loads = json.loads
+
 logger = get_logger("client")
 
 # Binance Futures Testnet base URL
 BASE_URL = "https://testnet.binancefuture.com"
 
+# Lazily constructed shared client (see get_default_client)
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client():
+    """
+    Return a lazily constructed, process-wide shared client.
+
+    Construction (env loading, session setup) is deferred until the
+    first caller actually needs the client, and double-checked locking
+    keeps concurrent first calls from building two instances.
+
+    Returns:
+        BinanceFuturesClient: The shared client instance.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = BinanceFuturesClient()
+    return _default_client
+
 
 class BinanceAPIError(Exception):
     """Custom exception for Binance API errors."""
@@ -54,7 +91,10 @@ class BinanceFuturesClient:
                 ".env",
             )
 
-        load_dotenv(env_path)
+        # Deployments that inject the keys via the environment don't
+        # need (and may not have) a .env file — skip the stat + parse.
+        if not (os.environ.get("API_Key") and os.environ.get("Secret_Key")):
+            load_dotenv(env_path)
 
         self.api_key = os.getenv("API_Key")
         self.secret_key = os.getenv("Secret_Key")
@@ -65,6 +105,10 @@ class BinanceFuturesClient:
                 "Please check your .env configuration."
             )
 
+        # The secret never changes — encode it once instead of on
+        # every signature.
+        self._secret_bytes = self.secret_key.encode("utf-8")
+
         self.base_url = BASE_URL
         self.session = requests.Session()
         self.session.headers.update({
@@ -72,9 +116,45 @@ class BinanceFuturesClient:
             "Content-Type": "application/x-www-form-urlencoded",
         })
 
-        # Sync time with Binance server to avoid timestamp errors
+        # Larger keep-alive pool + retries so bursts of requests reuse
+        # warm TLS connections instead of re-handshaking per call.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=50,
+            # Idempotent methods only (urllib3's default) — a 502/504
+            # can land after an order was accepted, and re-POSTing it
+            # would place a duplicate trade. 429 is deliberately not
+            # retried either: blind sub-second retries are how Binance
+            # escalates rate limiting to a 418 IP ban.
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
+
+        # Verb dispatch table — avoids the string-comparison ladder in
+        # _request on every call.
+        self._verbs = {
+            "GET": self.session.get,
+            "POST": self.session.post,
+            "DELETE": self.session.delete,
+            "PUT": self.session.put,
+        }
+
+        # aiohttp session for the async API — created lazily on first
+        # async call so it binds to the running event loop.
+        self._aio_session = None
+
+        # Server-time offset to avoid timestamp errors. The first sync
+        # is deferred to the first signed request so construction never
+        # blocks on a round-trip (unsigned market-data callers skip it
+        # entirely); a daemon thread keeps the offset fresh after that.
         self._time_offset = 0
-        self._sync_time()
+        self._time_synced = False
+        self._time_lock = threading.Lock()
+        threading.Thread(target=self._sync_time_loop, daemon=True).start()
 
         logger.info("Binance Futures Testnet client initialized")
         logger.debug("Base URL: %s", self.base_url)
@@ -89,40 +169,52 @@ class BinanceFuturesClient:
         try:
             url = f"{self.base_url}/fapi/v1/time"
             response = self.session.get(url, timeout=10)
-            server_time = response.json().get("serverTime", 0)
+            server_time = _json_loads(response.content).get("serverTime", 0)
             local_time = int(time.time() * 1000)
-            self._time_offset = server_time - local_time
+            with self._time_lock:
+                self._time_offset = server_time - local_time
             logger.debug(
                 "Time sync: server=%s local=%s offset=%sms",
-                server_time, local_time, self._time_offset,
+                server_time, local_time, server_time - local_time,
             )
         except Exception as e:
             logger.warning("Failed to sync time with server: %s", e)
-            self._time_offset = 0
+            with self._time_lock:
+                self._time_offset = 0
+        self._time_synced = True
+
+    def _sync_time_loop(self, interval=300):
+        """Background refresh of the server-time offset every `interval` seconds."""
+        while True:
+            time.sleep(interval)
+            self._sync_time()
 
     # ─── Signing ──────────────────────────────────────────────
 
     def _get_timestamp(self):
         """Get current timestamp in milliseconds, adjusted for server offset."""
-        return int(time.time() * 1000) + self._time_offset
+        if not self._time_synced:
+            self._sync_time()
+        with self._time_lock:
+            return int(time.time() * 1000) + self._time_offset
 
-    def _sign(self, params):
+    def _sign(self, query_string):
         """
-        Create HMAC SHA256 signature for the given parameters.
+        Create HMAC SHA256 signature for an urlencoded query string.
 
         Args:
-            params: Dictionary of query parameters.
+            query_string: The already-serialized query string.
 
         Returns:
             str: The hex-encoded HMAC SHA256 signature.
         """
-        query_string = urlencode(params)
-        signature = hmac.new(
-            self.secret_key.encode("utf-8"),
+        # hmac.digest() is a single C call into OpenSSL's one-shot HMAC,
+        # skipping the Python-level hmac.HMAC object entirely.
+        return hmac.digest(
+            self._secret_bytes,
             query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-        return signature
+            "sha256",
+        ).hex()
 
     # ─── HTTP Requests ────────────────────────────────────────
 
@@ -148,35 +240,40 @@ class BinanceFuturesClient:
 
         if signed:
             params["timestamp"] = self._get_timestamp()
-            params["signature"] = self._sign(params)
+
+        # Serialize once — the signed bytes and the transmitted bytes
+        # are guaranteed identical, and requests skips re-encoding.
+        query_string = urlencode(params, doseq=True)
 
         url = f"{self.base_url}{path}"
 
-        logger.debug("%s %s | params=%s", method, path, {
-            k: v for k, v in params.items() if k != "signature"
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s %s | query=%s", method, path, query_string)
+
+        if signed:
+            query_string = f"{query_string}&signature={self._sign(query_string)}"
+
+        full_url = f"{url}?{query_string}" if query_string else url
+
+        fn = self._verbs.get(method)
+        if fn is None:
+            raise ValueError(f"Unsupported HTTP method: {method}")
 
         try:
-            if method == "GET":
-                response = self.session.get(url, params=params, timeout=30)
-            elif method == "POST":
-                response = self.session.post(url, data=params, timeout=30)
-            elif method == "DELETE":
-                response = self.session.delete(url, params=params, timeout=30)
-            elif method == "PUT":
-                response = self.session.put(url, data=params, timeout=30)
+            if method in ("GET", "DELETE"):
+                response = fn(full_url, timeout=30)
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+                response = fn(url, data=query_string, timeout=30)
 
-            data = response.json()
+            data = _json_loads(response.content)
 
-            # Check for API error
-            if isinstance(data, dict) and "code" in data and data["code"] != 200:
-                # Binance returns negative error codes
-                if data["code"] < 0 or (data["code"] > 0 and data["code"] != 200):
-                    raise BinanceAPIError(data["code"], data.get("msg", "Unknown error"))
+            # Check for API error (Binance returns non-200 codes)
+            code = data.get("code") if isinstance(data, dict) else None
+            if code is not None and code != 200:
+                raise BinanceAPIError(code, data.get("msg", "Unknown error"))
 
-            logger.debug("Response: %s", data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response: %s", data)
             return data
 
         except requests.exceptions.Timeout:
@@ -189,6 +286,99 @@ class BinanceFuturesClient:
             logger.error("Request failed: %s", str(e))
             raise
 
+    # ─── Async HTTP Requests ──────────────────────────────────
+
+    def _get_aio_session(self):
+        """Create the aiohttp session on first use (inside a running loop)."""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                headers={
+                    "X-MBX-APIKEY": self.api_key,
+                    "Content-Type": "application/x-www-form-urlencoded",
+                },
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300),
+            )
+        return self._aio_session
+
+    async def _arequest(self, method, path, params=None, signed=True):
+        """
+        Async counterpart of _request().
+
+        Uses a shared aiohttp.ClientSession so many independent calls
+        can run concurrently via asyncio.gather().
+
+        Args:
+            method: HTTP method ('GET', 'POST', 'PUT', 'DELETE').
+            path: API endpoint path (e.g. '/fapi/v1/order').
+            params: Dictionary of request parameters.
+            signed: Whether to sign the request (default: True).
+
+        Returns:
+            dict: Parsed JSON response.
+
+        Raises:
+            BinanceAPIError: If the API returns an error response.
+            aiohttp.ClientError: For network-level errors.
+        """
+        if params is None:
+            params = {}
+
+        if signed:
+            # The deferred first sync is a blocking HTTP round-trip; on
+            # the event loop it would stall every in-flight coroutine,
+            # so run it in an executor instead.
+            if not self._time_synced:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._sync_time,
+                )
+            params["timestamp"] = self._get_timestamp()
+
+        # Serialize once, same as the sync path — sign exactly the
+        # bytes that go on the wire.
+        query_string = urlencode(params, doseq=True)
+
+        url = f"{self.base_url}{path}"
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s %s | query=%s", method, path, query_string)
+
+        if signed:
+            query_string = f"{query_string}&signature={self._sign(query_string)}"
+
+        session = self._get_aio_session()
+
+        try:
+            async with session.request(
+                method,
+                url,
+                params=query_string if method in ("GET", "DELETE") else None,
+                data=query_string if method in ("POST", "PUT") else None,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                data = _json_loads(await response.read())
+
+            # Check for API error (Binance returns non-200 codes)
+            code = data.get("code") if isinstance(data, dict) else None
+            if code is not None and code != 200:
+                raise BinanceAPIError(code, data.get("msg", "Unknown error"))
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response: %s", data)
+            return data
+
+        except asyncio.TimeoutError:
+            logger.error("Request timed out: %s %s", method, path)
+            raise
+        except aiohttp.ClientError as e:
+            logger.error("Request failed: %s", str(e))
+            raise
+
+    async def aclose(self):
+        """Close the aiohttp session (call once when done with async calls)."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+            self._aio_session = None
+
     # ─── Account Endpoints ────────────────────────────────────
 
     def get_balance(self):
@@ -201,6 +391,11 @@ class BinanceFuturesClient:
         logger.info("Fetching account balance...")
         return self._request("GET", "/fapi/v2/balance")
 
+    async def aget_balance(self):
+        """Async variant of get_balance()."""
+        logger.info("Fetching account balance...")
+        return await self._arequest("GET", "/fapi/v2/balance")
+
     def get_account(self):
         """
         Get current account information including positions.
@@ -230,6 +425,15 @@ class BinanceFuturesClient:
             signed=False,
         )
 
+    async def aget_price(self, symbol):
+        """Async variant of get_price()."""
+        logger.info("Fetching price for %s...", symbol)
+        return await self._arequest(
+            "GET", "/fapi/v1/ticker/price",
+            params={"symbol": symbol},
+            signed=False,
+        )
+
     def get_exchange_info(self, symbol=None):
         """
         Get exchange trading rules and symbol info.
@@ -266,17 +470,20 @@ class BinanceFuturesClient:
         Returns:
             dict: Order response from Binance.
         """
+        # The strategy classes already deliver validated-uppercase
+        # values, so only re-allocate when a direct caller passes
+        # lowercase input.
         params = {
-            "symbol": symbol.upper(),
-            "side": side.upper(),
-            "type": order_type.upper(),
+            "symbol": symbol if symbol.isupper() else symbol.upper(),
+            "side": side if side.isupper() else side.upper(),
+            "type": order_type if order_type.isupper() else order_type.upper(),
             "quantity": str(quantity),
         }
 
         # Add optional parameters
         for key, value in kwargs.items():
             if value is not None:
-                params[key] = str(value)
+                params[key] = value if isinstance(value, str) else str(value)
 
         logger.info(
             "Placing %s %s order: %s %s @ %s",
@@ -286,6 +493,39 @@ class BinanceFuturesClient:
 
         return self._request("POST", "/fapi/v1/order", params=params)
 
+    async def aplace_order(self, symbol, side, order_type, quantity, **kwargs):
+        """
+        Async variant of place_order().
+
+        Accepts the same arguments; callers can asyncio.gather() many
+        of these to submit independent orders concurrently.
+
+        Returns:
+            dict: Order response from Binance.
+        """
+        # The strategy classes already deliver validated-uppercase
+        # values, so only re-allocate when a direct caller passes
+        # lowercase input.
+        params = {
+            "symbol": symbol if symbol.isupper() else symbol.upper(),
+            "side": side if side.isupper() else side.upper(),
+            "type": order_type if order_type.isupper() else order_type.upper(),
+            "quantity": str(quantity),
+        }
+
+        # Add optional parameters
+        for key, value in kwargs.items():
+            if value is not None:
+                params[key] = value if isinstance(value, str) else str(value)
+
+        logger.info(
+            "Placing %s %s order: %s %s @ %s",
+            order_type, side, quantity, symbol,
+            kwargs.get("price", "MARKET"),
+        )
+
+        return await self._arequest("POST", "/fapi/v1/order", params=params)
+
     def get_open_orders(self, symbol=None):
         """
         Get all open orders for a symbol.
@@ -300,7 +540,8 @@ class BinanceFuturesClient:
         if symbol:
             params["symbol"] = symbol.upper()
 
-        logger.info("Fetching open orders%s...", f" for {symbol}" if symbol else "")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Fetching open orders%s...", f" for {symbol}" if symbol else "")
         return self._request("GET", "/fapi/v1/openOrders", params=params)
 
     def cancel_order(self, symbol, order_id):
@@ -3,8 +3,11 @@ Logging configuration for the Binance Futures Trading Bot.
 Provides Rich console output and plain-text file logging.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 
 from rich.logging import RichHandler
@@ -12,6 +15,11 @@ from rich.logging import RichHandler
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
 LOG_FILE = os.path.join(LOG_DIR, "trading_bot.log")
 
+# Process-wide guard — repeated setup_logging() calls (shell loops,
+# tests importing cli) return immediately instead of re-running the
+# makedirs/handler checks.
+_configured = False
+
 
 class PlainFormatter(logging.Formatter):
     """Plain formatter for file logging — production-readable."""
@@ -27,6 +35,10 @@ def setup_logging(console_level=logging.INFO, file_level=logging.DEBUG):
     """
     Set up logging with Rich console handler and plain file handler.
 
+    Both handlers run on a background QueueListener thread, so hot-path
+    logger calls only enqueue the record — console rendering and file
+    flushes never block an order on their I/O.
+
     Args:
         console_level: Logging level for console output (default: INFO).
         file_level: Logging level for file output (default: DEBUG).
@@ -34,6 +46,10 @@ def setup_logging(console_level=logging.INFO, file_level=logging.DEBUG):
     Returns:
         logging.Logger: Configured root logger for the bot.
     """
+    global _configured
+    if _configured:
+        return logging.getLogger("trading_bot")
+
     os.makedirs(LOG_DIR, exist_ok=True)
 
     logger = logging.getLogger("trading_bot")
@@ -41,6 +57,7 @@ def setup_logging(console_level=logging.INFO, file_level=logging.DEBUG):
 
     # Prevent duplicate handlers on repeated calls
     if logger.handlers:
+        _configured = True
         return logger
 
     # Console handler — Rich, INFO level
@@ -52,14 +69,34 @@ def setup_logging(console_level=logging.INFO, file_level=logging.DEBUG):
         markup=True,
     )
     console_handler.setLevel(console_level)
-    logger.addHandler(console_handler)
 
     # File handler — plain text, DEBUG level
     file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
-    file_handler.setLevel(file_level)
     file_handler.setFormatter(PlainFormatter())
-    logger.addHandler(file_handler)
 
+    # Batch routine records in memory; flush on capacity, on the first
+    # WARNING-or-worse record, and at shutdown — far fewer write syscalls.
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=256,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    buffered_file_handler.setLevel(file_level)
+    atexit.register(buffered_file_handler.flush)
+
+    # Producers enqueue; the listener thread does the actual I/O
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, buffered_file_handler,
+        respect_handler_level=True,
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    _configured = True
     return logger
 
 
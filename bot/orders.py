@@ -9,7 +9,9 @@ Architecture:
     Each strategy validates, builds params, and executes via the client.
 """
 
-from bot.client import BinanceFuturesClient, BinanceAPIError
+import asyncio
+
+from bot.client import BinanceFuturesClient, BinanceAPIError, get_default_client
 from bot.validators import (
     validate_order_params,
     validate_symbol,
@@ -29,8 +31,13 @@ class BaseOrder:
 
     Subclasses implement build_params() to produce the
     Binance API parameter dict for their specific order type.
+
+    Slotted — order objects are created per call, so skipping the
+    per-instance __dict__ keeps high-churn paths cheap.
     """
 
+    __slots__ = ("symbol", "side", "quantity", "_validated")
+
     def __init__(self, symbol, side, quantity):
         self.symbol = symbol
         self.side = side
@@ -68,6 +75,29 @@ class BaseOrder:
         )
         return result
 
+    async def aexecute(self, client):
+        """Async mirror of execute() — awaits client.aplace_order()."""
+        self.validate()
+        params = self.build_params()
+
+        logger.info(
+            "Executing %s: %s %s %s",
+            self.__class__.__name__,
+            params.get("order_type", "?"),
+            params.get("side", "?"),
+            params.get("symbol", "?"),
+        )
+
+        result = await client.aplace_order(**params)
+
+        logger.info(
+            "✅ %s placed — orderId=%s, status=%s",
+            self.__class__.__name__,
+            result.get("orderId"),
+            result.get("status"),
+        )
+        return result
+
     def summary(self):
         """Return a dict summarizing the order for confirmation display."""
         raise NotImplementedError
@@ -76,6 +106,8 @@ class BaseOrder:
 class MarketOrder(BaseOrder):
     """Market order — executes immediately at best available price."""
 
+    __slots__ = ()
+
     def validate(self):
         self._validated = validate_order_params(
             self.symbol, self.side, "MARKET", self.quantity,
@@ -105,6 +137,8 @@ class MarketOrder(BaseOrder):
 class LimitOrder(BaseOrder):
     """Limit order — sits on the order book at a specific price."""
 
+    __slots__ = ("price",)
+
     def __init__(self, symbol, side, quantity, price):
         super().__init__(symbol, side, quantity)
         self.price = price
@@ -145,6 +179,8 @@ class StopLimitOrder(BaseOrder):
     Maps to Binance type="STOP", timeInForce="GTC".
     """
 
+    __slots__ = ("stop_price", "limit_price")
+
     def __init__(self, symbol, side, quantity, stop_price, limit_price):
         super().__init__(symbol, side, quantity)
         self.stop_price = stop_price
@@ -185,12 +221,13 @@ class StopLimitOrder(BaseOrder):
 
 # ─── Functional API (backwards-compatible) ────────────────────
 
-def place_market_order(client, symbol, side, quantity):
+def place_market_order(client=None, symbol=None, side=None, quantity=None):
     """
     Place a MARKET order.
 
     Args:
-        client: BinanceFuturesClient instance.
+        client: BinanceFuturesClient instance, or None to use the
+                shared lazily-constructed default client.
         symbol: Trading pair (e.g. 'BTCUSDT').
         side: 'BUY' or 'SELL'.
         quantity: Order quantity.
@@ -199,15 +236,16 @@ def place_market_order(client, symbol, side, quantity):
         dict: Order response from Binance API.
     """
     order = MarketOrder(symbol, side, quantity)
-    return order.execute(client)
+    return order.execute(client or get_default_client())
 
 
-def place_limit_order(client, symbol, side, quantity, price):
+def place_limit_order(client=None, symbol=None, side=None, quantity=None, price=None):
     """
     Place a LIMIT order.
 
     Args:
-        client: BinanceFuturesClient instance.
+        client: BinanceFuturesClient instance, or None to use the
+                shared lazily-constructed default client.
         symbol: Trading pair (e.g. 'BTCUSDT').
         side: 'BUY' or 'SELL'.
         quantity: Order quantity.
@@ -217,10 +255,11 @@ def place_limit_order(client, symbol, side, quantity, price):
         dict: Order response from Binance API.
     """
     order = LimitOrder(symbol, side, quantity, price)
-    return order.execute(client)
+    return order.execute(client or get_default_client())
 
 
-def place_stop_limit_order(client, symbol, side, quantity, stop_price, limit_price):
+def place_stop_limit_order(client=None, symbol=None, side=None, quantity=None,
+                           stop_price=None, limit_price=None):
     """
     Place a STOP-LIMIT order.
 
@@ -228,7 +267,8 @@ def place_stop_limit_order(client, symbol, side, quantity, stop_price, limit_pri
     Binance API mapping: type="STOP", timeInForce="GTC".
 
     Args:
-        client: BinanceFuturesClient instance.
+        client: BinanceFuturesClient instance, or None to use the
+                shared lazily-constructed default client.
         symbol: Trading pair (e.g. 'BTCUSDT').
         side: 'BUY' or 'SELL'.
         quantity: Order quantity.
@@ -239,17 +279,50 @@ def place_stop_limit_order(client, symbol, side, quantity, stop_price, limit_pri
         dict: Order response from Binance API.
     """
     order = StopLimitOrder(symbol, side, quantity, stop_price, limit_price)
-    return order.execute(client)
+    return order.execute(client or get_default_client())
+
+
+async def place_orders(client, orders, max_concurrency=20):
+    """
+    Place a batch of independent orders concurrently.
+
+    Fans the submissions out over the client's async API so N orders
+    complete in roughly one round-trip instead of N. A semaphore caps
+    in-flight requests to stay inside Binance's per-IP rate limit.
+
+    Args:
+        client: BinanceFuturesClient instance, or None to use the
+                shared lazily-constructed default client.
+        orders: List of BaseOrder instances (MarketOrder, LimitOrder, ...).
+        max_concurrency: Maximum simultaneous in-flight requests.
+
+    Returns:
+        list: Per-order results in input order; failed entries hold the
+              exception instead of a response dict.
+    """
+    client = client or get_default_client()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _submit(order):
+        async with semaphore:
+            return await order.aexecute(client)
+
+    logger.info("Placing batch of %d order(s) concurrently...", len(orders))
+    return await asyncio.gather(
+        *(_submit(order) for order in orders),
+        return_exceptions=True,
+    )
 
 
 # ─── Order Management ────────────────────────────────────────
 
-def get_open_orders(client, symbol=None):
+def get_open_orders(client=None, symbol=None):
     """
     Fetch open orders, optionally filtered by symbol.
 
     Args:
-        client: BinanceFuturesClient instance.
+        client: BinanceFuturesClient instance, or None to use the
+                shared lazily-constructed default client.
         symbol: Optional trading pair symbol.
 
     Returns:
@@ -258,17 +331,18 @@ def get_open_orders(client, symbol=None):
     if symbol:
         symbol = validate_symbol(symbol)
 
-    orders = client.get_open_orders(symbol)
+    orders = (client or get_default_client()).get_open_orders(symbol)
     logger.info("Found %d open order(s)", len(orders))
     return orders
 
 
-def cancel_order(client, symbol, order_id):
+def cancel_order(client=None, symbol=None, order_id=None):
     """
     Cancel a specific order by its ID.
 
     Args:
-        client: BinanceFuturesClient instance.
+        client: BinanceFuturesClient instance, or None to use the
+                shared lazily-constructed default client.
         symbol: Trading pair symbol.
         order_id: The numeric order ID to cancel.
 
@@ -282,23 +356,24 @@ def cancel_order(client, symbol, order_id):
     except (TypeError, ValueError):
         raise ValidationError(f"Invalid order ID: '{order_id}'. Must be a number.")
 
-    result = client.cancel_order(symbol, order_id)
+    result = (client or get_default_client()).cancel_order(symbol, order_id)
     logger.info("✅ Order %s cancelled — status=%s", order_id, result.get("status"))
     return result
 
 
-def cancel_all_orders(client, symbol):
+def cancel_all_orders(client=None, symbol=None):
     """
     Cancel all open orders for a symbol.
 
     Args:
-        client: BinanceFuturesClient instance.
+        client: BinanceFuturesClient instance, or None to use the
+                shared lazily-constructed default client.
         symbol: Trading pair symbol.
 
     Returns:
         dict: Cancellation response.
     """
     symbol = validate_symbol(symbol)
-    result = client.cancel_all_orders(symbol)
+    result = (client or get_default_client()).cancel_all_orders(symbol)
     logger.info("✅ All orders cancelled for %s", symbol)
     return result
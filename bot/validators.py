@@ -5,14 +5,26 @@ Validates symbol, side, order type, quantity, price, and stop price
 before sending requests to the Binance API.
 """
 
+import logging
+from functools import lru_cache
+
 from bot.logging_config import get_logger
 
 logger = get_logger("validators")
 
-# Valid enum values
-VALID_SIDES = ("BUY", "SELL")
-VALID_ORDER_TYPES = ("MARKET", "LIMIT", "STOP_LIMIT")
-VALID_TIME_IN_FORCE = ("GTC", "IOC", "FOK", "GTD")
+# Valid enum values — frozensets for O(1) membership on the hot path;
+# ordered display tuples kept separately for error messages.
+VALID_SIDES = frozenset(("BUY", "SELL"))
+VALID_ORDER_TYPES = frozenset(("MARKET", "LIMIT", "STOP_LIMIT"))
+VALID_TIME_IN_FORCE = frozenset(("GTC", "IOC", "FOK", "GTD"))
+
+_VALID_SIDES_DISPLAY = ("BUY", "SELL")
+_VALID_ORDER_TYPES_DISPLAY = ("MARKET", "LIMIT", "STOP_LIMIT")
+
+# Delete-table of every allowed symbol character; translate() returns
+# an empty string only when the symbol contains nothing else, so the
+# check needs no intermediate string when the symbol is valid.
+_SYMBOL_TRANS = str.maketrans("", "", "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
 
 
 class ValidationError(Exception):
@@ -20,10 +32,35 @@ class ValidationError(Exception):
     pass
 
 
+@lru_cache(maxsize=256)
+def _validate_symbol_impl(symbol):
+    """Cached core of validate_symbol — keyed on the raw input string."""
+    symbol = symbol.strip().upper()
+
+    if len(symbol) < 2:
+        raise ValidationError(f"Symbol '{symbol}' is too short. Example: BTCUSDT")
+
+    # translate() catches disallowed characters; strip("_") catches
+    # symbols that are nothing but underscores, which the delete-table
+    # alone would let through.
+    if not symbol.strip("_") or symbol.translate(_SYMBOL_TRANS):
+        raise ValidationError(
+            f"Symbol '{symbol}' contains invalid characters. "
+            "Only alphanumeric characters are allowed."
+        )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Symbol validated: %s", symbol)
+    return symbol
+
+
 def validate_symbol(symbol):
     """
     Validate a trading pair symbol.
 
+    Traders reuse a handful of symbols, so the string normalization
+    and checks are cached per raw input via lru_cache.
+
     Args:
         symbol: The symbol string (e.g. 'BTCUSDT').
 
@@ -36,19 +73,7 @@ def validate_symbol(symbol):
     if not symbol or not isinstance(symbol, str):
         raise ValidationError("Symbol is required and must be a non-empty string.")
 
-    symbol = symbol.strip().upper()
-
-    if len(symbol) < 2:
-        raise ValidationError(f"Symbol '{symbol}' is too short. Example: BTCUSDT")
-
-    if not symbol.replace("_", "").isalnum():
-        raise ValidationError(
-            f"Symbol '{symbol}' contains invalid characters. "
-            "Only alphanumeric characters are allowed."
-        )
-
-    logger.debug("Symbol validated: %s", symbol)
-    return symbol
+    return _validate_symbol_impl(symbol)
 
 
 def validate_side(side):
@@ -71,10 +96,12 @@ def validate_side(side):
 
     if side not in VALID_SIDES:
         raise ValidationError(
-            f"Invalid order side: '{side}'. Must be one of: {', '.join(VALID_SIDES)}"
+            f"Invalid order side: '{side}'. "
+            f"Must be one of: {', '.join(_VALID_SIDES_DISPLAY)}"
         )
 
-    logger.debug("Side validated: %s", side)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Side validated: %s", side)
     return side
 
 
@@ -99,10 +126,11 @@ def validate_order_type(order_type):
     if order_type not in VALID_ORDER_TYPES:
         raise ValidationError(
             f"Invalid order type: '{order_type}'. "
-            f"Must be one of: {', '.join(VALID_ORDER_TYPES)}"
+            f"Must be one of: {', '.join(_VALID_ORDER_TYPES_DISPLAY)}"
         )
 
-    logger.debug("Order type validated: %s", order_type)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Order type validated: %s", order_type)
     return order_type
 
 
@@ -131,7 +159,8 @@ def validate_quantity(quantity):
             f"Quantity must be greater than 0, got: {qty}"
         )
 
-    logger.debug("Quantity validated: %s", qty)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Quantity validated: %s", qty)
     return qty
 
 
@@ -160,7 +189,8 @@ def validate_price(price):
             f"Price must be greater than 0, got: {p}"
         )
 
-    logger.debug("Price validated: %s", p)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Price validated: %s", p)
     return p
 
 
@@ -189,14 +219,61 @@ def validate_stop_price(stop_price):
             f"Stop price must be greater than 0, got: {sp}"
         )
 
-    logger.debug("Stop price validated: %s", sp)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Stop price validated: %s", sp)
     return sp
 
 
+# ─── Per-Type Validation Dispatch ────────────────────────────
+
+
+def _validate_market(validated, price, stop_price):
+    """MARKET — no extra fields; warn if a price was given."""
+    if price is not None:
+        logger.warning(
+            "Price parameter ignored for MARKET orders. "
+            "The order will execute at the current market price."
+        )
+
+
+def _validate_limit(validated, price, stop_price):
+    """LIMIT — requires price."""
+    if price is None:
+        raise ValidationError(
+            "Price is required for LIMIT orders. "
+            "Use MARKET type for market-price orders."
+        )
+    validated["price"] = validate_price(price)
+
+
+def _validate_stop_limit(validated, price, stop_price):
+    """STOP_LIMIT — requires both price and stop_price."""
+    if price is None:
+        raise ValidationError(
+            "Limit price is required for STOP_LIMIT orders."
+        )
+    if stop_price is None:
+        raise ValidationError(
+            "Stop (trigger) price is required for STOP_LIMIT orders."
+        )
+    validated["price"] = validate_price(price)
+    validated["stop_price"] = validate_stop_price(stop_price)
+
+
+_VALIDATORS = {
+    "MARKET": _validate_market,
+    "LIMIT": _validate_limit,
+    "STOP_LIMIT": _validate_stop_limit,
+}
+
+
 def validate_order_params(symbol, side, order_type, quantity, price=None, stop_price=None):
     """
     Validate all order parameters together.
 
+    Type-specific requirements are dispatched through _VALIDATORS, so
+    the common MARKET path skips the price/stop branch chain entirely.
+
     Args:
         symbol: Trading pair symbol.
         side: Order side ('BUY' or 'SELL').
@@ -219,46 +296,19 @@ def validate_order_params(symbol, side, order_type, quantity, price=None, stop_p
     }
 
     otype = validated["order_type"]
-
-    # LIMIT — requires price
-    if otype == "LIMIT":
-        if price is None:
-            raise ValidationError(
-                "Price is required for LIMIT orders. "
-                "Use MARKET type for market-price orders."
-            )
-        validated["price"] = validate_price(price)
-
-    # STOP_LIMIT — requires both price and stop_price
-    elif otype == "STOP_LIMIT":
-        if price is None:
-            raise ValidationError(
-                "Limit price is required for STOP_LIMIT orders."
-            )
-        if stop_price is None:
-            raise ValidationError(
-                "Stop (trigger) price is required for STOP_LIMIT orders."
-            )
-        validated["price"] = validate_price(price)
-        validated["stop_price"] = validate_stop_price(stop_price)
-
-    # MARKET — warn if price given
-    elif price is not None:
-        logger.warning(
-            "Price parameter ignored for MARKET orders. "
-            "The order will execute at the current market price."
+    _VALIDATORS[otype](validated, price, stop_price)
+
+    if logger.isEnabledFor(logging.INFO):
+        detail = ""
+        if otype == "LIMIT":
+            detail = f" price={validated['price']}"
+        elif otype == "STOP_LIMIT":
+            detail = f" stop={validated['stop_price']} limit={validated['price']}"
+
+        logger.info(
+            "All parameters validated: %s %s %s qty=%s%s",
+            otype, validated["side"], validated["symbol"],
+            validated["quantity"], detail,
         )
 
-    detail = ""
-    if otype == "LIMIT":
-        detail = f" price={validated['price']}"
-    elif otype == "STOP_LIMIT":
-        detail = f" stop={validated['stop_price']} limit={validated['price']}"
-
-    logger.info(
-        "All parameters validated: %s %s %s qty=%s%s",
-        otype, validated["side"], validated["symbol"],
-        validated["quantity"], detail,
-    )
-
     return validated
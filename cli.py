@@ -2,88 +2,192 @@
 """
 Binance Futures Testnet Trading Bot — CLI Interface.
 
-Dual-mode CLI powered by Typer + Rich:
+Dual-mode CLI built on argparse + Rich:
   Interactive:  python cli.py trade
   Direct:       python cli.py trade --symbol BTCUSDT --side BUY --type MARKET --qty 0.002
   Utilities:    python cli.py balance | price | open-orders | cancel | cancel-all
+
+argparse keeps startup an order of magnitude lighter than Typer/Click
+for this flat six-command surface, and Rich plus the bot package are
+imported lazily inside the commands that need them — `--help` and
+argument errors never pay their import cost.
 """
 
+import argparse
+import functools
+import re
 import sys
-from typing import Optional
-
-import typer
-from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm, FloatPrompt
-from rich.text import Text
-
-from bot.logging_config import setup_logging, get_logger
-from bot.client import BinanceFuturesClient, BinanceAPIError
-from bot.validators import ValidationError
-from bot.orders import (
-    MarketOrder,
-    LimitOrder,
-    StopLimitOrder,
-    place_market_order,
-    place_limit_order,
-    place_stop_limit_order,
-    get_open_orders,
-    cancel_order,
-    cancel_all_orders,
-)
 
-logger = get_logger("cli")
-console = Console()
-app = typer.Typer(
-    name="trading-bot",
-    help="🤖 Binance Futures Testnet Trading Bot",
-    add_completion=False,
-    no_args_is_help=True,
-)
+
+@functools.lru_cache(maxsize=None)
+def _get_console():
+    """Build the shared Rich console on first use."""
+    from rich.console import Console
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """Construct the Binance client once per process and reuse it."""
+    from bot.client import BinanceFuturesClient
+    return BinanceFuturesClient()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_logger():
+    """Fetch the CLI logger on first use (pulls in logging config lazily)."""
+    from bot.logging_config import get_logger
+    return get_logger("cli")
+
+
+def _dim(msg):
+    """Write a dim status line straight to stdout.
+
+    These one-line notices don't need layout or wrapping, so skipping the
+    Rich render pipeline keeps them nearly free; the ANSI codes are
+    dropped when stdout isn't a terminal.
+    """
+    text = msg.strip("\n")
+    lead = msg[:len(msg) - len(msg.lstrip("\n"))]
+    trail = msg[len(msg.rstrip("\n")):]
+    if sys.stdout.isatty():
+        sys.stdout.write(lead + "  \x1b[2m" + text + "\x1b[0m\n" + trail)
+    else:
+        sys.stdout.write(lead + "  " + text + "\n" + trail)
+
+
+def _print_json(data):
+    """Emit raw JSON to stdout — the fast path for scripted pipelines."""
+    try:
+        import orjson
+        sys.stdout.write(orjson.dumps(data).decode() + "\n")
+    except ImportError:
+        import json
+        sys.stdout.write(json.dumps(data, default=str) + "\n")
 
 
 # ─── Display Helpers ──────────────────────────────────────────
+#
+# Constant renderables (banner, panel titles) are built once behind
+# lru_cached getters — Rich re-tokenizes markup strings on every
+# print, so reusing Text/Panel objects skips that parse entirely.
+
+@functools.lru_cache(maxsize=None)
+def _get_header_group():
+    """Pre-built banner renderable — constant across the process."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Group(
+        "",
+        Panel(
+            Text("Binance Futures Testnet Trading Bot", style="bold cyan"),
+            border_style="cyan",
+            padding=(0, 2),
+        ),
+    )
 
-def show_header():
-    """Print the app banner."""
-    console.print()
-    console.print(Panel(
-        "[bold cyan]Binance Futures Testnet Trading Bot[/bold cyan]",
-        border_style="cyan",
-        padding=(0, 2),
-    ))
 
+@functools.lru_cache(maxsize=None)
+def _get_error_title():
+    """Pre-built error panel title."""
+    from rich.text import Text
+    return Text("❌ Order Failed", style="bold red")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_summary_title():
+    """Pre-built order-summary panel title."""
+    from rich.text import Text
+    return Text("📋 Order Summary", style="bold cyan")
+
+
+# Column definitions are constant per table shape — declared once here so
+# the builders just iterate instead of re-stating (name, style) pairs at
+# every call site.
+_SUMMARY_COLS = (("Field", "yellow"), ("Value", "white bold"))
+_BALANCE_COLS = (
+    ("Asset", "bold white"),
+    ("Balance", "green"),
+    ("Available", "yellow"),
+    ("Unrealized PnL", "magenta"),
+)
+_ORDERS_COLS = (
+    ("#", "dim"),
+    ("Order ID", "bold"),
+    ("Symbol", "white"),
+    ("Side", "yellow"),
+    ("Type", "cyan"),
+    ("Qty", "green"),
+    ("Price", "magenta"),
+    ("Status", "bold green"),
+)
+_BATCH_COLS = (
+    ("#", "dim"),
+    ("Symbol", "white"),
+    ("Type", "cyan"),
+    ("Side", "yellow"),
+    ("Order ID", "bold"),
+    ("Status", None),
+)
+
+
+def _build_summary_table(data: dict):
+    """Borderless Field/Value table used by the success and summary panels."""
+    from rich.table import Table
 
-def show_success(title, data: dict):
-    """Display a success panel with order details."""
     table = Table(show_header=False, box=None, padding=(0, 2))
-    table.add_column("Field", style="yellow")
-    table.add_column("Value", style="white bold")
+    for name, style in _SUMMARY_COLS:
+        table.add_column(name, style=style)
     for key, value in data.items():
         table.add_row(str(key), str(value))
+    return table
+
 
-    console.print()
-    console.print(Panel(
-        table,
-        title=f"[bold green]✅ {title}[/bold green]",
-        border_style="green",
-        padding=(1, 2),
+def show_header():
+    """Print the app banner."""
+    # One print per helper — each console.print re-parses markup and
+    # recomputes ANSI, so batching the fragments cuts Rich overhead.
+    _get_console().print(_get_header_group())
+
+
+def show_success(title, data: dict):
+    """Display a success panel with order details."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+
+    table = _build_summary_table(data)
+
+    _get_console().print(Group(
+        "",
+        Panel(
+            table,
+            title=Text(f"✅ {title}", style="bold green"),
+            border_style="green",
+            padding=(1, 2),
+        ),
+        "",
     ))
-    console.print()
 
 
 def show_error(message):
     """Display an error panel."""
-    console.print()
-    console.print(Panel(
-        f"[bold]{message}[/bold]",
-        title="[bold red]❌ Order Failed[/bold red]",
-        border_style="red",
-        padding=(1, 2),
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+
+    _get_console().print(Group(
+        "",
+        Panel(
+            Text(str(message), style="bold"),
+            title=_get_error_title(),
+            border_style="red",
+            padding=(1, 2),
+        ),
+        "",
     ))
-    console.print()
 
 
 def show_order_summary(summary: dict) -> bool:
@@ -92,72 +196,168 @@ def show_order_summary(summary: dict) -> bool:
 
     Returns True if user confirms, False otherwise.
     """
-    table = Table(show_header=False, box=None, padding=(0, 2))
-    table.add_column("Field", style="yellow")
-    table.add_column("Value", style="white bold")
-    for key, value in summary.items():
-        table.add_row(str(key), str(value))
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.prompt import Confirm
 
-    console.print()
-    console.print(Panel(
-        table,
-        title="[bold cyan]📋 Order Summary[/bold cyan]",
-        border_style="cyan",
-        padding=(1, 2),
+    table = _build_summary_table(summary)
+
+    _get_console().print(Group(
+        "",
+        Panel(
+            table,
+            title=_get_summary_title(),
+            border_style="cyan",
+            padding=(1, 2),
+        ),
     ))
 
     return Confirm.ask("\n  Confirm order?", default=False)
 
 
+# Bound format methods — the format spec is parsed once instead of on
+# every row render.
+_fmt4 = "{:,.4f}".format
+_fmt2 = "${:,.2f}".format
+
+# (display label, response key, fallback) for format_result
+_RESULT_FIELDS = (
+    ("Order ID", "orderId", "—"),
+    ("Symbol", "symbol", "—"),
+    ("Side", "side", "—"),
+    ("Type", "type", "—"),
+    ("Status", "status", "—"),
+    ("Quantity", "origQty", "—"),
+    ("Price", "price", "—"),
+    ("Stop Price", "stopPrice", "—"),
+    ("Executed Qty", "executedQty", "0"),
+    ("Average Price", "avgPrice", "—"),
+)
+
+
 def format_result(result: dict) -> dict:
     """Extract key fields from the Binance order response."""
-    return {
-        "Order ID": result.get("orderId", "—"),
-        "Symbol": result.get("symbol", "—"),
-        "Side": result.get("side", "—"),
-        "Type": result.get("type", "—"),
-        "Status": result.get("status", "—"),
-        "Quantity": result.get("origQty", "—"),
-        "Price": result.get("price", "—"),
-        "Stop Price": result.get("stopPrice", "—"),
-        "Executed Qty": result.get("executedQty", "0"),
-        "Average Price": result.get("avgPrice", "—"),
-    }
+    return {label: result.get(key, default) for label, key, default in _RESULT_FIELDS}
 
 
 # ─── Interactive Trade Flow ───────────────────────────────────
 
+# Compiled once — symbol shape check on the input fast path. Deliberately
+# a superset of what validate_symbol accepts (underscores cover quarterly
+# futures like BTCUSDT_240927, and no upper length bound because the full
+# validator has none) so the pre-check never rejects an order the full
+# validator would allow.
+_SYMBOL_RE = re.compile(r"[A-Z0-9_]{2,}")
+
+
+def _validate_inputs(symbol, side, qty, price=None, stop_price=None):
+    """
+    Cheap sanity checks before any order object is constructed.
+
+    Catches obvious bad input (wrong side, malformed symbol,
+    non-positive numbers) with a few comparisons, so typos fail fast
+    instead of paying for order construction and the full validator
+    pass first. The strategy classes still run complete validation.
+
+    Raises:
+        ValidationError: On the first failed check.
+    """
+    from bot.validators import ValidationError
+
+    if side not in ("BUY", "SELL"):
+        raise ValidationError(f"Invalid side: '{side}'. Must be one of: BUY, SELL")
+    if not symbol or not _SYMBOL_RE.fullmatch(symbol):
+        raise ValidationError(
+            f"Invalid symbol: '{symbol}'. "
+            "Expected at least 2 letters, digits or underscores."
+        )
+    if qty is None or qty <= 0:
+        raise ValidationError(f"Invalid quantity: {qty}. Must be a positive number.")
+    if price is not None and price <= 0:
+        raise ValidationError(f"Invalid price: {price}. Must be a positive number.")
+    if stop_price is not None and stop_price <= 0:
+        raise ValidationError(
+            f"Invalid stop price: {stop_price}. Must be a positive number."
+        )
+
+
+# Per-menu-choice form layout: (field list, example line)
+_TRADE_FORMS = {
+    "1": ("SYMBOL SIDE QTY", "BTCUSDT BUY 0.002"),
+    "2": ("SYMBOL SIDE QTY PRICE", "BTCUSDT BUY 0.002 60000"),
+    "3": ("SYMBOL SIDE QTY STOP_PRICE LIMIT_PRICE", "BTCUSDT SELL 0.002 58000 57900"),
+}
+
+
 def interactive_trade(client):
     """Run the interactive trading menu."""
+    from rich.console import Group
+
+    from bot.client import BinanceAPIError
+    from bot.orders import LimitOrder, MarketOrder, StopLimitOrder
+    from bot.validators import ValidationError
+
+    console = _get_console()
     show_header()
 
-    console.print("  [bold]Select Order Type:[/bold]")
-    console.print("  [cyan]1.[/cyan] Market Order")
-    console.print("  [cyan]2.[/cyan] Limit Order")
-    console.print("  [cyan]3.[/cyan] Stop-Limit Order")
-    console.print("  [cyan]4.[/cyan] Exit")
-    console.print()
+    console.print(Group(
+        "  [bold]Select Order Type:[/bold]",
+        "  [cyan]1.[/cyan] Market Order",
+        "  [cyan]2.[/cyan] Limit Order",
+        "  [cyan]3.[/cyan] Stop-Limit Order",
+        "  [cyan]4.[/cyan] Exit",
+        "",
+    ))
 
-    choice = Prompt.ask("  Enter choice", choices=["1", "2", "3", "4"], default="4")
+    choice = input("  Enter choice [1/2/3/4] (4): ").strip() or "4"
+    while choice not in ("1", "2", "3", "4"):
+        choice = input("  Please enter 1, 2, 3 or 4 (4): ").strip() or "4"
 
     if choice == "4":
-        console.print("  [dim]Exiting...[/dim]")
+        _dim("Exiting...")
         return
 
-    # Common inputs
-    symbol = Prompt.ask("  Enter Symbol [dim](e.g. BTCUSDT)[/dim]").strip().upper()
-    side = Prompt.ask("  Enter Side", choices=["BUY", "SELL", "buy", "sell"]).strip().upper()
-    quantity = FloatPrompt.ask("  Enter Quantity")
+    # Single-shot form: one render, one line of input — no per-question
+    # prompt/redraw cycle.
+    fields, example = _TRADE_FORMS[choice]
+    console.print(Group(
+        f"  [bold]Enter order as:[/bold] [cyan]{fields}[/cyan]",
+        f"  [dim]e.g. {example}[/dim]",
+        "",
+    ))
+
+    expected = len(fields.split())
+    while True:
+        tokens = input("  > ").split()
+        if len(tokens) != expected:
+            console.print(f"  [red]Expected {expected} values:[/red] {fields}")
+            continue
+        try:
+            quantity, *extras = (float(t) for t in tokens[2:])
+        except ValueError:
+            console.print("  [red]Quantity and prices must be numbers.[/red]")
+            continue
+        symbol = tokens[0].upper()
+        side = tokens[1].upper()
+        try:
+            if choice == "1":
+                _validate_inputs(symbol, side, quantity)
+            elif choice == "2":
+                _validate_inputs(symbol, side, quantity, price=extras[0])
+            else:
+                _validate_inputs(symbol, side, quantity,
+                                 price=extras[1], stop_price=extras[0])
+        except ValidationError as e:
+            console.print(f"  [red]{e}[/red]")
+            continue
+        break
 
     if choice == "1":
         order = MarketOrder(symbol, side, quantity)
     elif choice == "2":
-        price = FloatPrompt.ask("  Enter Limit Price")
-        order = LimitOrder(symbol, side, quantity, price)
+        order = LimitOrder(symbol, side, quantity, extras[0])
     elif choice == "3":
-        stop_price = FloatPrompt.ask("  Enter Stop Price [dim](trigger)[/dim]")
-        limit_price = FloatPrompt.ask("  Enter Limit Price")
-        order = StopLimitOrder(symbol, side, quantity, stop_price, limit_price)
+        order = StopLimitOrder(symbol, side, quantity, extras[0], extras[1])
 
     # Validate first
     try:
@@ -169,7 +369,7 @@ def interactive_trade(client):
     # Show summary and confirm
     summary = order.summary()
     if not show_order_summary(summary):
-        console.print("  [dim]Order cancelled by user.[/dim]\n")
+        _dim("Order cancelled by user.\n")
         return
 
     # Execute
@@ -179,120 +379,239 @@ def interactive_trade(client):
     except BinanceAPIError as e:
         show_error(f"Binance API Error [{e.code}]: {e.message}")
     except Exception as e:
-        logger.exception("Unexpected error during order execution")
+        _get_logger().exception("Unexpected error during order execution")
         show_error(f"Unexpected error: {e}")
 
 
 # ─── CLI Commands ──────────────────────────────────────────────
 
-@app.command()
-def trade(
-    symbol: Optional[str] = typer.Option(None, "--symbol", "-s", help="Trading pair (e.g. BTCUSDT)"),
-    side: Optional[str] = typer.Option(None, "--side", help="BUY or SELL"),
-    order_type: Optional[str] = typer.Option(None, "--type", "-t", help="MARKET, LIMIT, or STOP_LIMIT"),
-    qty: Optional[float] = typer.Option(None, "--qty", "-q", help="Order quantity"),
-    price: Optional[float] = typer.Option(None, "--price", "-p", help="Limit price"),
-    stop_price: Optional[float] = typer.Option(None, "--stop-price", help="Stop/trigger price"),
-):
+def _trade_batch(client, path, json_out=False):
+    """
+    Validate and submit a JSON batch of orders concurrently.
+
+    The file holds a list of order dicts, e.g.
+    [{"type": "LIMIT", "symbol": "BTCUSDT", "side": "BUY",
+      "qty": 0.002, "price": 60000}, ...]. All orders are validated
+    before anything is sent; submissions then fan out over a bounded
+    thread pool so N orders overlap their round-trips instead of
+    paying N serial RTTs.
+    """
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.console import Group
+    from rich.table import Table
+
+    from bot.orders import LimitOrder, MarketOrder, StopLimitOrder
+    from bot.validators import ValidationError
+
+    try:
+        with open(path) as f:
+            specs = json.load(f)
+    except (OSError, ValueError) as e:
+        show_error(f"Failed to read batch file: {e}")
+        raise SystemExit(1)
+
+    builders = {
+        "MARKET": lambda s: MarketOrder(s["symbol"], s["side"], s["qty"]),
+        "LIMIT": lambda s: LimitOrder(s["symbol"], s["side"], s["qty"], s["price"]),
+        "STOP_LIMIT": lambda s: StopLimitOrder(
+            s["symbol"], s["side"], s["qty"], s["stop_price"], s["price"],
+        ),
+    }
+
+    # Validate everything up front — one bad order aborts the batch
+    # before any money moves.
+    orders = []
+    try:
+        for n, spec in enumerate(specs, 1):
+            builder = builders.get(str(spec.get("type", "")).upper())
+            if builder is None:
+                raise ValidationError(f"Order #{n}: unknown type '{spec.get('type')}'")
+            try:
+                order = builder(spec)
+            except KeyError as e:
+                raise ValidationError(f"Order #{n}: missing field {e}")
+            order.validate()
+            orders.append(order)
+    except ValidationError as e:
+        show_error(str(e))
+        raise SystemExit(1)
+
+    def _submit(order):
+        try:
+            return order.execute(client)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(_submit, orders))
+
+    failures = sum(isinstance(r, Exception) for r in results)
+
+    if json_out:
+        _print_json([
+            {"error": str(r)} if isinstance(r, Exception) else r
+            for r in results
+        ])
+        if failures:
+            raise SystemExit(1)
+        return
+
+    table = Table(
+        title=f"Batch Results — {len(orders)} order(s)",
+        border_style="cyan",
+        padding=(0, 1),
+    )
+    for name, style in _BATCH_COLS:
+        table.add_column(name, style=style)
+
+    for n, (order, result) in enumerate(zip(orders, results), 1):
+        if isinstance(result, Exception):
+            table.add_row(
+                str(n), order.symbol, order.__class__.__name__,
+                str(order.side), "—", f"[red]{result}[/red]",
+            )
+        else:
+            table.add_row(
+                str(n), order.symbol, order.__class__.__name__,
+                str(order.side), str(result.get("orderId", "—")),
+                f"[green]{result.get('status', '—')}[/green]",
+            )
+
+    _get_console().print(Group("", table, ""))
+    if failures:
+        raise SystemExit(1)
+
+
+def trade(symbol=None, side=None, order_type=None, qty=None, price=None, stop_price=None,
+          batch=None, json_out=False):
     """
     Place an order — interactive menu or direct CLI flags.
 
     Interactive:  python cli.py trade
     Direct:       python cli.py trade --symbol BTCUSDT --side BUY --type MARKET --qty 0.002
+    Batch:        python cli.py trade --batch orders.json
     """
-    setup_logging()
+    from bot.client import BinanceAPIError
+    from bot.orders import LimitOrder, MarketOrder, StopLimitOrder
+    from bot.validators import ValidationError
+
     try:
-        client = BinanceFuturesClient()
+        client = _get_client()
     except Exception as e:
         show_error(f"Failed to initialize client: {e}")
-        raise typer.Exit(1)
+        raise SystemExit(1)
+
+    # Batch mode — submit a JSON file of orders concurrently
+    if batch is not None:
+        _trade_batch(client, batch, json_out)
+        return
 
     # If no flags provided → interactive mode
     if not any([symbol, side, order_type, qty]):
         try:
             interactive_trade(client)
         except KeyboardInterrupt:
-            console.print("\n  [dim]Interrupted by user.[/dim]")
+            _dim("\nInterrupted by user.")
         return
 
     # Direct mode — all required flags must be present
     if not all([symbol, side, order_type, qty]):
         show_error("Direct mode requires: --symbol, --side, --type, and --qty")
-        raise typer.Exit(1)
+        raise SystemExit(1)
 
     order_type = order_type.upper()
     side = side.upper()
 
     # Build the order
     try:
+        _validate_inputs(symbol.upper(), side, qty, price=price,
+                         stop_price=stop_price)
         if order_type == "MARKET":
             order = MarketOrder(symbol, side, qty)
         elif order_type == "LIMIT":
             if price is None:
                 show_error("LIMIT orders require --price")
-                raise typer.Exit(1)
+                raise SystemExit(1)
             order = LimitOrder(symbol, side, qty, price)
         elif order_type == "STOP_LIMIT":
             if price is None or stop_price is None:
                 show_error("STOP_LIMIT orders require --price and --stop-price")
-                raise typer.Exit(1)
+                raise SystemExit(1)
             order = StopLimitOrder(symbol, side, qty, stop_price, price)
         else:
             show_error(f"Unknown order type: {order_type}")
-            raise typer.Exit(1)
+            raise SystemExit(1)
 
         order.validate()
     except ValidationError as e:
         show_error(str(e))
-        raise typer.Exit(1)
-
-    # Summary + confirm
-    summary = order.summary()
-    if not show_order_summary(summary):
-        console.print("  [dim]Order cancelled by user.[/dim]\n")
-        return
+        raise SystemExit(1)
+
+    # Summary + confirm — skipped in JSON mode, which targets scripts
+    # where stdin may not even be a terminal.
+    if not json_out:
+        summary = order.summary()
+        if not show_order_summary(summary):
+            _dim("Order cancelled by user.\n")
+            return
 
     # Execute
     try:
         result = order.execute(client)
-        show_success("Order Executed Successfully", format_result(result))
+        if json_out:
+            _print_json(result)
+        else:
+            show_success("Order Executed Successfully", format_result(result))
     except BinanceAPIError as e:
         show_error(f"Binance API Error [{e.code}]: {e.message}")
-        raise typer.Exit(1)
+        raise SystemExit(1)
 
 
-@app.command()
-def balance():
+def balance(json_out=False):
     """Show account balance."""
-    setup_logging()
+    from rich.console import Group
+    from rich.table import Table
+
+    from bot.client import BinanceAPIError
+
+    console = _get_console()
     try:
-        client = BinanceFuturesClient()
+        client = _get_client()
+        balances = client.get_balance()
+
+        if json_out:
+            _print_json(balances)
+            return
+
         show_header()
 
-        balances = client.get_balance()
-        non_zero = [b for b in balances if float(b.get("balance", 0)) != 0]
+        # Parse each row once; the filter pass reuses the same floats
+        # instead of re-converting in the render loop.
+        parsed = [
+            (
+                b.get("asset", "?"),
+                float(b.get("balance", 0)),
+                float(b.get("availableBalance", 0)),
+                float(b.get("crossUnPnl", 0)),
+            )
+            for b in balances
+        ]
+        non_zero = [row for row in parsed if row[1] != 0]
 
         if not non_zero:
-            console.print("  [dim]No balances found (all zero)[/dim]\n")
+            _dim("No balances found (all zero)\n")
             return
 
         table = Table(title="Account Balance", border_style="cyan", padding=(0, 1))
-        table.add_column("Asset", style="bold white")
-        table.add_column("Balance", style="green")
-        table.add_column("Available", style="yellow")
-        table.add_column("Unrealized PnL", style="magenta")
+        for name, style in _BALANCE_COLS:
+            table.add_column(name, style=style)
 
-        for b in non_zero:
-            table.add_row(
-                b.get("asset", "?"),
-                f"{float(b.get('balance', 0)):,.4f}",
-                f"{float(b.get('availableBalance', 0)):,.4f}",
-                f"{float(b.get('crossUnPnl', 0)):,.4f}",
-            )
+        for asset, bal, avail, pnl in non_zero:
+            table.add_row(asset, _fmt4(bal), _fmt4(avail), _fmt4(pnl))
 
-        console.print()
-        console.print(table)
-        console.print()
+        console.print(Group("", table, ""))
 
     except BinanceAPIError as e:
         show_error(f"Binance API Error [{e.code}]: {e.message}")
@@ -300,24 +619,35 @@ def balance():
         show_error(f"Error: {e}")
 
 
-@app.command()
-def price(symbol: str = typer.Argument(..., help="Trading pair (e.g. BTCUSDT)")):
+def price(symbol, json_out=False):
     """Get current price for a symbol."""
-    setup_logging()
+    from rich.console import Group
+    from rich.panel import Panel
+
+    from bot.client import BinanceAPIError
+
+    console = _get_console()
     try:
-        client = BinanceFuturesClient()
+        client = _get_client()
         symbol = symbol.upper()
         data = client.get_price(symbol)
+
+        if json_out:
+            _print_json(data)
+            return
+
         p = float(data.get("price", 0))
 
-        console.print()
-        console.print(Panel(
-            f"[bold white]{symbol}[/bold white]  →  [bold green]${p:,.2f}[/bold green]",
-            title="[cyan]💰 Current Price[/cyan]",
-            border_style="cyan",
-            padding=(0, 2),
+        console.print(Group(
+            "",
+            Panel(
+                f"[bold white]{symbol}[/bold white]  →  [bold green]{_fmt2(p)}[/bold green]",
+                title="[cyan]💰 Current Price[/cyan]",
+                border_style="cyan",
+                padding=(0, 2),
+            ),
+            "",
         ))
-        console.print()
 
     except BinanceAPIError as e:
         show_error(f"Binance API Error [{e.code}]: {e.message}")
@@ -325,50 +655,58 @@ def price(symbol: str = typer.Argument(..., help="Trading pair (e.g. BTCUSDT)"))
         show_error(f"Error: {e}")
 
 
-@app.command("open-orders")
-def open_orders(
-    symbol: Optional[str] = typer.Argument(None, help="Trading pair (optional)"),
-):
+# Rows per rendered table chunk in open_orders — bounds the Text
+# objects Rich materializes at once and gets output flowing early.
+_ORDERS_CHUNK_SIZE = 500
+
+# Response keys rendered per open-orders row, in column order.
+_ORDERS_KEYS = ("orderId", "symbol", "side", "type", "origQty", "price", "status")
+
+
+def _build_orders_table(title=None):
+    """Construct an empty open-orders table with the standard columns."""
+    from rich.table import Table
+
+    table = Table(title=title, border_style="cyan", padding=(0, 1))
+    for name, style in _ORDERS_COLS:
+        table.add_column(name, style=style)
+    return table
+
+
+def open_orders(symbol=None, json_out=False):
     """List open orders."""
-    setup_logging()
-    try:
-        client = BinanceFuturesClient()
-        show_header()
+    from rich.console import Group
+
+    from bot.client import BinanceAPIError
+    from bot.orders import get_open_orders
 
+    console = _get_console()
+    try:
+        client = _get_client()
         orders = get_open_orders(client, symbol)
 
+        if json_out:
+            _print_json(orders)
+            return
+
+        show_header()
+
         if not orders:
-            console.print("  [dim]No open orders found[/dim]\n")
+            _dim("No open orders found\n")
             return
 
-        table = Table(
-            title=f"Open Orders{' — ' + symbol.upper() if symbol else ''}",
-            border_style="cyan",
-            padding=(0, 1),
-        )
-        table.add_column("#", style="dim")
-        table.add_column("Order ID", style="bold")
-        table.add_column("Symbol", style="white")
-        table.add_column("Side", style="yellow")
-        table.add_column("Type", style="cyan")
-        table.add_column("Qty", style="green")
-        table.add_column("Price", style="magenta")
-        table.add_column("Status", style="bold green")
-
-        for i, o in enumerate(orders, 1):
-            table.add_row(
-                str(i),
-                str(o.get("orderId", "—")),
-                o.get("symbol", "—"),
-                o.get("side", "—"),
-                o.get("type", "—"),
-                o.get("origQty", "—"),
-                o.get("price", "—"),
-                o.get("status", "—"),
-            )
+        title = f"Open Orders{' — ' + symbol.upper() if symbol else ''}"
+
+        # Render in chunks so huge order lists stream incrementally
+        # instead of materializing one enormous table.
+        for start in range(0, len(orders), _ORDERS_CHUNK_SIZE):
+            chunk = orders[start:start + _ORDERS_CHUNK_SIZE]
+            table = _build_orders_table(title if start == 0 else None)
+            for i, o in enumerate(chunk, start + 1):
+                get = o.get
+                table.add_row(str(i), *(str(get(k, "—")) for k in _ORDERS_KEYS))
+            console.print(Group("", table))
 
-        console.print()
-        console.print(table)
         console.print(f"\n  [cyan]Total: {len(orders)} order(s)[/cyan]\n")
 
     except BinanceAPIError as e:
@@ -377,16 +715,18 @@ def open_orders(
         show_error(f"Error: {e}")
 
 
-@app.command()
-def cancel(
-    symbol: str = typer.Argument(..., help="Trading pair (e.g. BTCUSDT)"),
-    order_id: int = typer.Argument(..., help="Order ID to cancel"),
-):
+def cancel(symbol, order_id, json_out=False):
     """Cancel a specific order."""
-    setup_logging()
+    from bot.client import BinanceAPIError
+    from bot.orders import cancel_order
+    from bot.validators import ValidationError
+
     try:
-        client = BinanceFuturesClient()
+        client = _get_client()
         result = cancel_order(client, symbol, order_id)
+        if json_out:
+            _print_json(result)
+            return
         show_success("Order Cancelled", {
             "Order ID": result.get("orderId", "—"),
             "Symbol": result.get("symbol", "—"),
@@ -400,18 +740,26 @@ def cancel(
         show_error(f"Error: {e}")
 
 
-@app.command("cancel-all")
-def cancel_all_cmd(
-    symbol: str = typer.Argument(..., help="Trading pair (e.g. BTCUSDT)"),
-):
+def cancel_all_cmd(symbol, json_out=False):
     """Cancel all open orders for a symbol."""
-    setup_logging()
+    from rich.prompt import Confirm
+
+    from bot.client import BinanceAPIError
+    from bot.orders import cancel_all_orders
+    from bot.validators import ValidationError
+
     try:
-        client = BinanceFuturesClient()
-        if not Confirm.ask(f"  Cancel ALL orders for [bold]{symbol.upper()}[/bold]?", default=False):
-            console.print("  [dim]Cancelled.[/dim]\n")
+        client = _get_client()
+        # JSON mode is for scripts — no interactive confirmation there.
+        if not json_out and not Confirm.ask(
+            f"  Cancel ALL orders for [bold]{symbol.upper()}[/bold]?", default=False,
+        ):
+            _dim("Cancelled.\n")
+            return
+        result = cancel_all_orders(client, symbol)
+        if json_out:
+            _print_json(result)
             return
-        cancel_all_orders(client, symbol)
         show_success("All Orders Cancelled", {"Symbol": symbol.upper()})
     except BinanceAPIError as e:
         show_error(f"Binance API Error [{e.code}]: {e.message}")
@@ -421,7 +769,146 @@ def cancel_all_cmd(
         show_error(f"Error: {e}")
 
 
+def shell():
+    """
+    Persistent interactive shell — reuses one client across commands.
+
+    Avoids re-paying logging setup and client construction on every
+    action the way single-shot subcommands do.
+    """
+    from rich.prompt import Prompt
+
+    console = _get_console()
+    try:
+        client = _get_client()
+    except Exception as e:
+        show_error(f"Failed to initialize client: {e}")
+        raise SystemExit(1)
+
+    show_header()
+    console.print(
+        "  [dim]Commands: trade | balance | price SYMBOL | open-orders [SYMBOL]"
+        " | cancel SYMBOL ID | cancel-all SYMBOL | exit[/dim]\n"
+    )
+
+    while True:
+        try:
+            line = Prompt.ask("  [bold cyan]trading-bot[/bold cyan]").strip()
+        except (KeyboardInterrupt, EOFError):
+            _dim("\nExiting shell.")
+            break
+
+        if not line:
+            continue
+
+        cmd, *args = line.split()
+        cmd = cmd.lower()
+
+        try:
+            if cmd in ("exit", "quit"):
+                break
+            elif cmd == "trade":
+                interactive_trade(client)
+            elif cmd == "balance":
+                balance()
+            elif cmd == "price" and args:
+                price(args[0])
+            elif cmd == "open-orders":
+                open_orders(args[0] if args else None)
+            elif cmd == "cancel" and len(args) == 2 and args[1].isdigit():
+                cancel(args[0], int(args[1]))
+            elif cmd == "cancel-all" and args:
+                cancel_all_cmd(args[0])
+            else:
+                console.print(f"  [red]Unknown or incomplete command:[/red] {line}")
+        except SystemExit:
+            pass
+        except KeyboardInterrupt:
+            _dim("\nInterrupted.")
+
+
 # ─── Main ──────────────────────────────────────────────────────
 
+def _build_parser():
+    """Build the argparse CLI — one subparser per command."""
+    parser = argparse.ArgumentParser(
+        prog="trading-bot",
+        description="🤖 Binance Futures Testnet Trading Bot",
+    )
+    sub = parser.add_subparsers(dest="cmd", metavar="COMMAND")
+
+    def _add_json_flag(p):
+        p.add_argument("--json", "-J", dest="json_out", action="store_true",
+                       help="Emit raw JSON and skip Rich rendering")
+
+    trade_p = sub.add_parser(
+        "trade", help="Place an order — interactive menu or direct CLI flags",
+    )
+    trade_p.add_argument("--symbol", "-s", help="Trading pair (e.g. BTCUSDT)")
+    trade_p.add_argument("--side", help="BUY or SELL")
+    trade_p.add_argument("--type", "-t", dest="order_type",
+                         help="MARKET, LIMIT, or STOP_LIMIT")
+    trade_p.add_argument("--qty", "-q", type=float, help="Order quantity")
+    trade_p.add_argument("--price", "-p", type=float, help="Limit price")
+    trade_p.add_argument("--stop-price", type=float, help="Stop/trigger price")
+    trade_p.add_argument("--batch", metavar="PATH",
+                         help="JSON file with a list of orders to submit concurrently")
+    _add_json_flag(trade_p)
+
+    balance_p = sub.add_parser("balance", help="Show account balance")
+    _add_json_flag(balance_p)
+
+    price_p = sub.add_parser("price", help="Get current price for a symbol")
+    price_p.add_argument("symbol", help="Trading pair (e.g. BTCUSDT)")
+    _add_json_flag(price_p)
+
+    oo_p = sub.add_parser("open-orders", help="List open orders")
+    oo_p.add_argument("symbol", nargs="?", default=None, help="Trading pair (optional)")
+    _add_json_flag(oo_p)
+
+    cancel_p = sub.add_parser("cancel", help="Cancel a specific order")
+    cancel_p.add_argument("symbol", help="Trading pair (e.g. BTCUSDT)")
+    cancel_p.add_argument("order_id", type=int, help="Order ID to cancel")
+    _add_json_flag(cancel_p)
+
+    cancel_all_p = sub.add_parser("cancel-all", help="Cancel all open orders for a symbol")
+    cancel_all_p.add_argument("symbol", help="Trading pair (e.g. BTCUSDT)")
+    _add_json_flag(cancel_all_p)
+
+    sub.add_parser("shell", help="Persistent interactive shell")
+
+    return parser
+
+
+# Dispatch table — argparse namespace in, command function out
+_COMMANDS = {
+    "trade": lambda a: trade(a.symbol, a.side, a.order_type, a.qty, a.price,
+                             a.stop_price, a.batch, a.json_out),
+    "balance": lambda a: balance(a.json_out),
+    "price": lambda a: price(a.symbol, a.json_out),
+    "open-orders": lambda a: open_orders(a.symbol, a.json_out),
+    "cancel": lambda a: cancel(a.symbol, a.order_id, a.json_out),
+    "cancel-all": lambda a: cancel_all_cmd(a.symbol, a.json_out),
+    "shell": lambda a: shell(),
+}
+
+
+def main(argv=None):
+    """Parse arguments and run the selected command."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if args.cmd is None:
+        parser.print_help()
+        return
+
+    # Logging is only initialized once a real command runs — --help and
+    # parse errors never open the log file.
+    from bot.logging_config import setup_logging
+    setup_logging()
+
+    _COMMANDS[args.cmd](args)
+
+
 if __name__ == "__main__":
-    app()
+    main()